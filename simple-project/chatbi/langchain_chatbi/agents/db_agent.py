@@ -1,5 +1,3 @@
-import re
-
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from loguru import logger
@@ -33,11 +31,11 @@ class DbAgent(LangChainAgentBase):
     def __init__(self, llm, callbacks=None):
         super().__init__(name="DbAgent", llm=llm, callbacks=callbacks)
 
+        self._parser = PydanticOutputParser(pydantic_object=DbResponse)
         self._db_prompt = ChatPromptTemplate.from_messages([
             ("system", self.SYSTEM_PROMPT),
             ("human", "Question: {question}\n\n{format_instructions}")
-        ])
-        self._parser = PydanticOutputParser(pydantic_object=DbResponse)
+        ]).partial(format_instructions=self._parser.get_format_instructions())
 
     async def select_db(
             self,
@@ -58,8 +56,7 @@ class DbAgent(LangChainAgentBase):
             # Format db
 
             messages = self._db_prompt.format_messages(
-                question=question,
-                format_instructions=self._parser.get_format_instructions()
+                question=question
             )
 
             response = await self._ainvoke(messages)
@@ -83,9 +80,8 @@ class DbAgent(LangChainAgentBase):
         - Markdown code blocks with ```sql
         - Generic code blocks
         """
-        # Remove markdown code blocks
-        db_pattern =  r'(?<=</think>).*'
-        result = re.search(db_pattern, text, re.DOTALL)
-        if result:
-            return result.group(0)
+        # Keep everything after the first </think> tag
+        _, sep, db = text.partition("</think>")
+        if sep:
+            return db
         return 'unknow_db'
\ No newline at end of file
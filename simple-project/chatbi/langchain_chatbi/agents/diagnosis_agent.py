@@ -63,12 +63,12 @@ Focus on actionable insights that help understand the business implications."""
         """
         super().__init__(name="DiagnosisAgent", llm=llm, callbacks=callbacks)
 
+        self._parser = PydanticOutputParser(pydantic_object=InsightSummary)
+
         self._prompt = ChatPromptTemplate.from_messages([
             ("system", "You are a Data Analyst expert. Analyze data and provide insights."),
             ("human", "{format_instructions}\n\n" + self.SYSTEM_PROMPT)
-        ])
-
-        self._parser = PydanticOutputParser(pydantic_object=InsightSummary)
+        ]).partial(format_instructions=self._parser.get_format_instructions())
 
     async def generate_diagnosis(
         self,
@@ -99,8 +99,7 @@ Focus on actionable insights that help understand the business implications."""
                 question=question,
                 sql=sql,
                 data_sample=formatted_sample,
-                row_count=len(data_sample),
-                format_instructions=self._parser.get_format_instructions()
+                row_count=len(data_sample)
             )
 
             response = await self._ainvoke(messages)
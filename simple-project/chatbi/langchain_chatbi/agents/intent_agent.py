@@ -81,21 +81,21 @@ Ambiguity types:
         """
         super().__init__(name="IntentClassificationAgent", llm=llm, callbacks=callbacks)
 
-        # Create intent classification prompt with format instructions
+        # Create parsers
+        self._intent_parser = PydanticOutputParser(pydantic_object=IntentClassification)
+        self._ambiguity_parser = PydanticOutputParser(pydantic_object=AmbiguityDetection)
+
+        # Create intent classification prompt with format instructions rendered once
         self._intent_prompt = ChatPromptTemplate.from_messages([
             ("system", self.INTENT_SYSTEM_PROMPT),
             ("human", "Question: {question}\n\nContext: {context}\n\n{format_instructions}")
-        ])
+        ]).partial(format_instructions=self._intent_parser.get_format_instructions())
 
-        # Create ambiguity detection prompt with format instructions
+        # Create ambiguity detection prompt with format instructions rendered once
         self._ambiguity_prompt = ChatPromptTemplate.from_messages([
             ("system", self.AMBIGUITY_SYSTEM_PROMPT),
             ("human", "Question: {question}\n\n{format_instructions}")
-        ])
-
-        # Create parsers
-        self._intent_parser = PydanticOutputParser(pydantic_object=IntentClassification)
-        self._ambiguity_parser = PydanticOutputParser(pydantic_object=AmbiguityDetection)
+        ]).partial(format_instructions=self._ambiguity_parser.get_format_instructions())
 
     def classify_sync(
         self,
@@ -119,8 +119,7 @@ Ambiguity types:
         try:
             messages = self._intent_prompt.format_messages(
                 question=question,
-                context=context,
-                format_instructions=self._intent_parser.get_format_instructions()
+                context=context
             )
 
             # Use synchronous invoke
@@ -167,8 +166,7 @@ Ambiguity types:
         try:
             messages = self._intent_prompt.format_messages(
                 question=question,
-                context=context,
-                format_instructions=self._intent_parser.get_format_instructions()
+                context=context
             )
 
             # Use structured output
@@ -210,8 +208,7 @@ Ambiguity types:
 
         try:
             messages = self._ambiguity_prompt.format_messages(
-                question=question,
-                format_instructions=self._ambiguity_parser.get_format_instructions()
+                question=question
             )
 
             response = self._invoke(messages)
@@ -252,8 +249,7 @@ Ambiguity types:
 
         try:
             messages = self._ambiguity_prompt.format_messages(
-                question=question,
-                format_instructions=self._ambiguity_parser.get_format_instructions()
+                question=question
             )
 
             response = await self._ainvoke(messages)
@@ -50,6 +50,8 @@ If a question can be answered with a single table, don't include unrelated table
         """
         super().__init__(name="SchemaAgent", llm=llm, callbacks=callbacks)
 
+        self._parser = PydanticOutputParser(pydantic_object=SchemaSelection)
+
         self._prompt = ChatPromptTemplate.from_messages([
             ("system", self.SYSTEM_PROMPT),
             ("human", """Question: {question}
@@ -60,9 +62,7 @@ Available Tables:
 Select the tables that are relevant to answering this question.
 
 {format_instructions}""")
-        ])
-
-        self._parser = PydanticOutputParser(pydantic_object=SchemaSelection)
+        ]).partial(format_instructions=self._parser.get_format_instructions())
 
     async def select_schemas(
         self,
@@ -88,8 +88,7 @@ Select the tables that are relevant to answering this question.
 
             messages = self._prompt.format_messages(
                 question=question,
-                table_schemas=formatted_schemas,
-                format_instructions=self._parser.get_format_instructions()
+                table_schemas=formatted_schemas
             )
 
             response = await self._ainvoke(messages)
@@ -15,6 +15,10 @@ from loguru import logger
 from langchain_chatbi.agents.base import LangChainAgentBase
 from langchain_chatbi.models.response_models import SQLGeneration
 
+# Patterns used by SqlAgent._extract_sql, compiled once at import time
+SQL_BLOCK_PATTERN = re.compile(r"```(?:sql)?\s*\n?(.*?)\n?```", re.DOTALL | re.IGNORECASE)
+SELECT_PATTERN = re.compile(r"(SELECT[\s\S]*?)(?:\n\n|\Z)", re.IGNORECASE)
+
 
 class SqlAgent(LangChainAgentBase):
     """
@@ -216,18 +220,16 @@ class SqlAgent(LangChainAgentBase):
         - Generic code blocks
         """
         # Remove markdown code blocks
-        sql_pattern = r"```(?:sql)?\s*\n?(.*?)\n?```"
-        matches = re.findall(sql_pattern, text, re.DOTALL | re.IGNORECASE)
+        match = SQL_BLOCK_PATTERN.search(text)
 
-        if matches:
-            return matches[0].strip()
+        if match:
+            return match.group(1).strip()
 
         # Look for SELECT statement (case insensitive)
-        select_pattern = r"(SELECT[\s\S]*?)(?:\n\n|\Z)"
-        select_matches = re.findall(select_pattern, text, re.IGNORECASE)
+        select_match = SELECT_PATTERN.search(text)
 
-        if select_matches:
-            return select_matches[0].strip()
+        if select_match:
+            return select_match.group(1).strip()
 
         # Fallback: return the whole text, cleaned up
         cleaned = text.strip()
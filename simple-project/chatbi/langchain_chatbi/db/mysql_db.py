@@ -11,6 +11,27 @@ import pymysql
 from loguru import logger
 
 
+TABLE_SCHEMA_SQL = """
+    SELECT
+        COLUMN_NAME as name,
+        DATA_TYPE as type,
+        IS_NULLABLE as nullable,
+        COLUMN_KEY as column_key,
+        COLUMN_DEFAULT as default_value,
+        COLUMN_COMMENT as comment
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+    ORDER BY ORDINAL_POSITION
+""".strip()
+
+ALL_TABLES_SQL = """
+    SELECT TABLE_NAME
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_SCHEMA = %s
+    ORDER BY TABLE_NAME
+""".strip()
+
+
 class MySQLConnection:
     """
     MySQL database connection wrapper.
@@ -172,20 +193,7 @@ class MySQLConnection:
         Returns:
             Dictionary with table schema information
         """
-        sql = """
-            SELECT
-                COLUMN_NAME as name,
-                DATA_TYPE as type,
-                IS_NULLABLE as nullable,
-                COLUMN_KEY as column_key,
-                COLUMN_DEFAULT as default_value,
-                COLUMN_COMMENT as comment
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-            ORDER BY ORDINAL_POSITION
-        """
-
-        result = self.run(sql, (self.database, table_name))
+        result = self.run(TABLE_SCHEMA_SQL, (self.database, table_name))
 
         return {
             "name": table_name,
@@ -209,14 +217,7 @@ class MySQLConnection:
         Returns:
             List of table names
         """
-        sql = """
-            SELECT TABLE_NAME
-            FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = %s
-            ORDER BY TABLE_NAME
-        """
-
-        result = self.run(sql, (self.database,))
+        result = self.run(ALL_TABLES_SQL, (self.database,))
         return [row["TABLE_NAME"] for row in result]
 
     def get_all_schemas(self) -> List[Dict[str, Any]]:
@@ -233,12 +234,15 @@ class MySQLConnection:
         """
         Test database connection.
 
+        Uses a protocol-level ping instead of a SELECT round-trip, and
+        reconnects if the server dropped an idle connection.
+
         Returns:
             True if connection is successful, False otherwise
         """
         try:
-            result = self.run("SELECT 1 as test")
-            return len(result) > 0 and result[0]["test"] == 1
+            self.connection.ping(reconnect=True)
+            return True
         except Exception as e:
             logger.error(f"[MySQL]: Connection test failed: {e}")
             return False
@@ -0,0 +1,108 @@
+"""
+Unit Tests for the Flask Web Application
+
+Tests status serialization of raw MySQL row values and the status endpoint.
+"""
+
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from langchain_chatbi.web import app as web_app
+from langchain_chatbi.web.app import _json_default, dumps_status
+
+
+# ============================================================================
+# Status Serialization Tests
+# ============================================================================
+
+
+class TestStatusSerialization:
+    """Test _json_default and dumps_status"""
+
+    def test_decimal_as_float(self):
+        """Test DECIMAL columns are serialized as numbers."""
+        assert _json_default(Decimal("12.50")) == 12.5
+
+    def test_datetime_format(self):
+        """Test DATETIME columns use 'YYYY-MM-DD HH:MM:SS'."""
+        value = datetime(2024, 1, 2, 3, 4, 5, 678901)
+        assert _json_default(value) == "2024-01-02 03:04:05"
+
+    def test_date_format(self):
+        """Test DATE columns use ISO format."""
+        assert _json_default(date(2024, 1, 2)) == "2024-01-02"
+
+    def test_time_column_as_timedelta(self):
+        """Test TIME columns (returned by pymysql as timedelta)."""
+        assert _json_default(timedelta(hours=13, minutes=5, seconds=7)) == "13:05:07"
+
+    def test_time_format(self):
+        """Test datetime.time values use ISO format."""
+        assert _json_default(time(13, 5, 7)) == "13:05:07"
+
+    def test_bytes_as_hex(self):
+        """Test BIT/BINARY/BLOB columns are serialized as hex."""
+        assert _json_default(b"\x01\xff") == "01ff"
+
+    def test_unsupported_type_rejected(self):
+        """Test unknown types still raise TypeError."""
+        with pytest.raises(TypeError):
+            _json_default(object())
+
+    def test_dumps_status_with_query_result(self):
+        """Test a full status payload with mixed row values."""
+        payload = {
+            "status": "completed",
+            "results": {
+                "sql_execution": {
+                    "query_result": [{
+                        "amount": Decimal("9.99"),
+                        "created_at": datetime(2024, 1, 2, 3, 4, 5),
+                        "name": "商品",
+                    }]
+                }
+            },
+        }
+
+        result = json.loads(dumps_status(payload))
+        row = result["results"]["sql_execution"]["query_result"][0]
+
+        assert row == {"amount": 9.99, "created_at": "2024-01-02 03:04:05", "name": "商品"}
+
+
+# ============================================================================
+# Status Endpoint Tests
+# ============================================================================
+
+
+class TestStatusEndpoint:
+    """Test /api/status conditional responses"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Flask test client with a status payload containing MySQL values."""
+        monkeypatch.setattr(web_app, "execution_status", {
+            "status": "completed",
+            "results": {"sql_execution": {"query_result": [{"amount": Decimal("1.5")}]}},
+        })
+        return web_app.app.test_client()
+
+    def test_status_sets_etag(self, client):
+        """Test the status response carries an ETag."""
+        response = client.get("/api/status")
+
+        assert response.status_code == 200
+        assert response.headers.get("ETag")
+        assert response.get_json()["results"]["sql_execution"]["query_result"] == [{"amount": 1.5}]
+
+    def test_status_not_modified(self, client):
+        """Test a matching If-None-Match returns 304 with an empty body."""
+        etag = client.get("/api/status").headers["ETag"]
+
+        response = client.get("/api/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
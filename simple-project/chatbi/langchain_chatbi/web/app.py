@@ -7,7 +7,8 @@ Provides a web interface to visualize agent execution status in real-time.
 import asyncio
 import os
 import json
-from datetime import datetime
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
 from typing import Dict, Any, List
 from flask import Flask, render_template, jsonify, request, stream_with_context
 from loguru import logger
@@ -63,6 +64,30 @@ execution_status: Dict[str, Any] = {
 }
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize MySQL row values that the json module cannot handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat(sep=' ', timespec='seconds')
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, dt_time):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        # pymysql returns MySQL TIME columns as timedelta
+        return str(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        # BIT/BINARY/BLOB columns
+        return obj.hex()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_status(payload: Dict[str, Any]) -> str:
+    """Serialize a status payload, including raw query result rows, in one pass."""
+    return json.dumps(payload, ensure_ascii=False, default=_json_default)
+
+
 def reset_status():
     """Reset execution status."""
     global execution_status
@@ -85,8 +110,11 @@ def index():
 
 @app.route('/api/status')
 def get_status():
-    """Get current execution status."""
-    return jsonify(execution_status)
+    """Get current execution status (supports If-None-Match for polling clients)."""
+    response = app.response_class(dumps_status(execution_status), mimetype='application/json')
+    response.add_etag()
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 
 @app.route('/api/execute', methods=['POST'])
@@ -180,7 +208,6 @@ def execute_query():
                             if "query_result" in node_output:
                                 if node_output["query_result"]:
                                     node_result["result_count"] = len(node_output["query_result"])
-                                    node_result["result_preview"] = node_output["query_result"][:3]
                                     node_result["query_result"] = node_output["query_result"]
                                 elif node_output.get("sql_error"):
                                     node_result["status"] = "failed"
@@ -243,7 +270,7 @@ def stream_status():
     def generate():
         last_update = ""
         while True:
-            current_status = json.dumps(execution_status)
+            current_status = dumps_status(execution_status)
             if current_status != last_update:
                 yield f"data: {current_status}\n\n"
                 last_update = current_status